@@ -0,0 +1,111 @@
+import unittest
+from unittest import mock
+
+import update_versions.semantic_versioning as sv
+from update_versions import _get_helm_versions
+from update_versions.cache import HelmChartVersionCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHelmChartVersionCache(unittest.TestCase):
+    @staticmethod
+    def chart_versions(*versions):
+        return {"chart": [sv.parse(v) for v in versions]}
+
+    def test_error_params(self):
+        with self.assertRaises(ValueError):
+            HelmChartVersionCache(max_bytes=0)
+        with self.assertRaises(ValueError):
+            HelmChartVersionCache(ttl=0)
+
+    def test_hit_miss(self):
+        cache = HelmChartVersionCache()
+        value = self.chart_versions("1.0.0")
+
+        self.assertIsNone(cache.get("https://charts.example.com"))
+        self.assertTrue(cache.put("https://charts.example.com/", value))
+        self.assertIs(cache.get("https://charts.example.com"), value)
+
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+        self.assertGreater(cache.size, 0)
+
+    def test_keyed_by_url(self):
+        cache = HelmChartVersionCache()
+        cache.put("https://a.example.com", self.chart_versions("1.0.0"))
+        cache.put("https://b.example.com", self.chart_versions("2.0.0"))
+
+        self.assertEqual(
+            cache.get("https://a.example.com")["chart"][0].version, "1.0.0")
+        self.assertEqual(
+            cache.get("https://b.example.com")["chart"][0].version, "2.0.0")
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = HelmChartVersionCache(ttl=10, clock=clock)
+        cache.put("https://charts.example.com", self.chart_versions("1.0.0"))
+
+        clock.now = 9
+        self.assertIn("https://charts.example.com", cache)
+
+        clock.now = 10
+        self.assertIsNone(cache.get("https://charts.example.com"))
+        self.assertEqual(cache.stats.expirations, 1)
+        self.assertEqual(cache.size, 0)
+        self.assertEqual(len(cache), 0)
+
+    def test_lru_eviction(self):
+        value = self.chart_versions("1.0.0", "1.1.0")
+        probe = HelmChartVersionCache()
+        probe.put("https://a", value)
+        entry_size = probe.size
+
+        cache = HelmChartVersionCache(max_bytes=entry_size * 2 + 1)
+        cache.put("https://a", self.chart_versions("1.0.0", "1.1.0"))
+        cache.put("https://b", self.chart_versions("1.0.0", "1.1.0"))
+        cache.get("https://a")
+        cache.put("https://c", self.chart_versions("1.0.0", "1.1.0"))
+
+        self.assertIn("https://a", cache)
+        self.assertNotIn("https://b", cache)
+        self.assertIn("https://c", cache)
+        self.assertEqual(cache.stats.evictions, 1)
+        self.assertLessEqual(cache.size, cache.max_bytes)
+
+    def test_entry_too_large(self):
+        cache = HelmChartVersionCache(max_bytes=1)
+
+        self.assertFalse(
+            cache.put("https://charts.example.com", self.chart_versions("1.0.0")))
+        self.assertEqual(len(cache), 0)
+
+    def test_get_helm_versions_uses_cache(self):
+        cache = HelmChartVersionCache()
+        response = mock.Mock(
+            text="entries:\n  chart:\n    - version: 1.0.0\n    - version: 1.2.0\n")
+
+        with mock.patch("update_versions.requests.get", return_value=response) as get:
+            first = _get_helm_versions(
+                "repo", "https://charts.example.com", "chart", cache)
+            second = _get_helm_versions(
+                "other", "https://charts.example.com/", "chart", cache)
+
+        get.assert_called_once_with(
+            "https://charts.example.com/index.yaml",
+            headers={"Cache-Control": "no-cache"},
+        )
+        self.assertEqual([v.version for v in first], ["1.2.0", "1.0.0"])
+        self.assertIs(first, second)
+        self.assertEqual(cache.stats.hits, 1)
+        self.assertEqual(cache.stats.misses, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
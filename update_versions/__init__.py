@@ -3,9 +3,10 @@ import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 import update_versions.semantic_versioning as sv
+from update_versions.cache import HelmChartVersionCache
 
 import requests
 import yaml
@@ -17,8 +18,6 @@ logging.basicConfig(
     level=logging.INFO,
 )
 
-_HELM_REPOSITORY_CHART_VERSION_CACHE = {}
-
 
 def _str2bool(v):
     if isinstance(v, bool):
@@ -36,21 +35,27 @@ def _remove_emtpy(entries):
         return [e for e in entries if e]
 
 
-def _get_helm_versions(repo_name: str, repo_url: str, chart_name) -> List[str]:
-    global _HELM_REPOSITORY_CHART_VERSION_CACHE
-
+def _get_helm_versions(
+    repo_name: str,
+    repo_url: str,
+    chart_name,
+    cache: HelmChartVersionCache,
+) -> List[str]:
     try:
-        if repo_name not in _HELM_REPOSITORY_CHART_VERSION_CACHE:
-            logging.info("Loading charts for repository '%s'", repo_name)
+        chart_versions = cache.get(repo_url)
+
+        if chart_versions is None:
+            logging.info(
+                "Loading charts for repository '%s' [%s]", repo_name, repo_url)
 
             response = requests.get(
-                f"{repo_url}/index.yaml", headers={'Cache-Control': 'no-cache'})
+                f"{repo_url.rstrip('/')}/index.yaml", headers={'Cache-Control': 'no-cache'})
 
             response.raise_for_status()
 
             index_data = yaml.safe_load(response.text)
 
-            _HELM_REPOSITORY_CHART_VERSION_CACHE[repo_name] = {}
+            chart_versions = {}
 
             for _key, _value in index_data.get("entries").items():
                 versions = [
@@ -62,11 +67,13 @@ def _get_helm_versions(repo_name: str, repo_url: str, chart_name) -> List[str]:
                     )
                 ]
 
-                _HELM_REPOSITORY_CHART_VERSION_CACHE[repo_name][_key] = versions
+                chart_versions[_key] = versions
+
+            cache.put(repo_url, chart_versions)
         else:
             logging.info("Repository '%s' already in cache", repo_name)
 
-        return _HELM_REPOSITORY_CHART_VERSION_CACHE.get(repo_name).get(chart_name)
+        return chart_versions.get(chart_name)
     except Exception as e:
         logging.warning("Error getting charts for '%s': %s", repo_name, str(e))
 
@@ -214,7 +221,14 @@ def _update_container(versions: Dict[str, Any], version_type: str) -> bool:
     return changed
 
 
-def _update_helm(versions: Dict[str, Any], version_type: str) -> bool:
+def _update_helm(
+    versions: Dict[str, Any],
+    version_type: str,
+    cache: Optional[HelmChartVersionCache] = None,
+) -> bool:
+    if cache is None:
+        cache = HelmChartVersionCache()
+
     helm_chart_versions = versions.get(HELM_CHART_VERSION_ATTRIBURE, {})
     helm_chart_repository = versions.get(HELM_CHART_REPOSITORY_ATTRIBURE, {})
 
@@ -229,7 +243,7 @@ def _update_helm(versions: Dict[str, Any], version_type: str) -> bool:
 
             if repo_url:
                 helm_versions = _get_helm_versions(
-                    repo_name, repo_url, chart_name)
+                    repo_name, repo_url, chart_name, cache)
                 last_version = sv.get_last_valid_version(
                     helm_versions,
                     current_version,
@@ -263,6 +277,7 @@ def update_versions(
     skip_helm: bool = False,
     skip_container: bool = False,
     dry_mode: bool = False,
+    cache: Optional[HelmChartVersionCache] = None,
 ) -> bool:
     with open(versions_file, "r") as f:
         logging.info("Reading versions file %s", versions_file)
@@ -276,7 +291,7 @@ def update_versions(
 
         if not skip_helm:
             logging.info("Updating Helm Chart versions")
-            changed = _update_helm(versions, version_type) or changed
+            changed = _update_helm(versions, version_type, cache) or changed
 
         if changed:
             if dry_mode:
@@ -290,4 +305,7 @@ def update_versions(
                 with open(versions_file, "w") as fw:
                     yaml.dump(versions, fw)
 
+        if cache is not None:
+            logging.info("Helm chart version cache stats: %s", cache.stats)
+
         return changed
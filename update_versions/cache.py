@@ -0,0 +1,132 @@
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 15 * 60
+
+
+def _sizeof(obj: Any) -> int:
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, dict):
+        size += sum(_sizeof(k) + _sizeof(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(_sizeof(v) for v in obj)
+    elif is_dataclass(obj) and not isinstance(obj, type):
+        size += sum(_sizeof(getattr(obj, f.name, None)) for f in fields(obj))
+
+    return size
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+@dataclass
+class _CacheEntry:
+    value: Dict[str, List[Any]]
+    size: int
+    expires_at: float
+
+
+class HelmChartVersionCache:
+    """
+    LRU cache of Helm repository chart versions keyed by repository URL.
+
+    Entries expire after `ttl` seconds and the least recently used ones are
+    evicted once the approximate size of the cached data exceeds `max_bytes`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: Optional[float] = DEFAULT_TTL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_bytes <= 0:
+            raise ValueError(f"Invalid cache max_bytes[{max_bytes}]")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Invalid cache ttl[{ttl}]")
+
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(repo_url: str) -> str:
+        return repo_url.rstrip("/")
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, repo_url: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(self._key(repo_url))
+            return entry is not None and entry.expires_at > self._clock()
+
+    def get(self, repo_url: str) -> Optional[Dict[str, List[Any]]]:
+        key = self._key(repo_url)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry.expires_at <= self._clock():
+                self._remove(key)
+                self.stats.expirations += 1
+                entry = None
+
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry.value
+
+    def put(self, repo_url: str, chart_versions: Dict[str, List[Any]]) -> bool:
+        key = self._key(repo_url)
+        size = _sizeof(key) + _sizeof(chart_versions)
+        expires_at = (
+            self._clock() + self.ttl if self.ttl is not None else float("inf")
+        )
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                return False
+
+            while self._entries and self._size + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+            self._entries[key] = _CacheEntry(chart_versions, size, expires_at)
+            self._size += size
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key)
+        self._size -= entry.size